@@ -1,13 +1,195 @@
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+import httpx
 import requests
-from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone
 from models import WeatherData
 
+try:
+    import orjson
+except ImportError:  # e.g. PyPy, where orjson wheels are unavailable
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; only needed for WeatherAPIService(stream_forecast=True)
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Freshness windows (in seconds) for cached responses. OpenWeatherMap refreshes
+# current conditions roughly every 10 minutes and forecasts roughly every hour.
+CURRENT_WEATHER_TTL = 600
+FORECAST_TTL = 3600
+
+# Bound once at import time so timestamp conversion skips the attribute lookups.
+_UTC = timezone.utc
+_FROMTS = datetime.fromtimestamp
+
+# Process-wide HTTP session and response cache, shared by every WeatherAPIService
+# so that all instances reuse the same pooled connections and cached results.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+# (endpoint, city) -> (stored_at, value, last_modified, etag), ordered from least to
+# most recently stored. Expired entries are kept for the stale fallback, so the size
+# bound is what keeps a long-lived process from growing without limit.
+_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, object, Optional[str], Optional[str]]]" = OrderedDict()
+_CACHE_MAXSIZE = 1024
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+class CacheInfo(NamedTuple):
+    """Response cache statistics, mirroring functools' lru_cache `cache_info()`."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _get_session() -> requests.Session:
+    """Return the shared requests.Session, creating it on first use.
+
+    The session mounts a pooled HTTPAdapter that retries transient server errors.
+
+    Returns:
+        requests.Session: The process-wide session.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and release its pooled connections.
+
+    The session is shared by every WeatherAPIService in the process, so only the
+    process owner (e.g. the CLI's main() or a server's shutdown hook) should call
+    this. A fresh session is created the next time any instance makes a request.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        session, _SESSION = _SESSION, None
+    if session is not None:
+        session.close()
+
+
+@functools.lru_cache(maxsize=4096)
+def _ts_to_dt(dt_int: int) -> datetime:
+    """Convert a UNIX timestamp to a timezone-aware UTC datetime, caching recent results."""
+    return _FROMTS(dt_int, _UTC)
+
+
+def _decode_json(response):
+    """Decode a JSON response body, preferring orjson when it is installed.
+
+    orjson parses the raw response bytes directly, skipping the intermediate text
+    decode done by `response.json()`. Falls back to the standard library otherwise.
+
+    Args:
+        response (requests.Response | httpx.Response): The HTTP response whose body should be decoded.
+
+    Returns:
+        The decoded JSON document (typically a dict).
+
+    Raises:
+        WeatherAPIError: If the body is not valid JSON.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except ValueError as e:  # orjson, json and requests decode errors all subclass ValueError
+        raise WeatherAPIError(f"Invalid JSON in API response: {e}") from e
+
+
+def _stream_forecast_data(raw) -> dict:
+    """Incrementally decode a /forecast response body with ijson.
+
+    Forecast entries are decoded as bytes arrive instead of after the whole body
+    has been downloaded. Only the fields read by the parser ("list" and
+    "city.name") are kept.
+
+    Args:
+        raw: A binary file-like object yielding the response body (e.g. `response.raw`).
+
+    Returns:
+        dict: A trimmed document with the same shape as the decoded JSON response.
+
+    Raises:
+        WeatherAPIError: If the body is not valid JSON.
+    """
+    items = []
+    city_name = None
+    builder = None
+    try:
+        for prefix, event, value in ijson.parse(raw, use_float=True):
+            if prefix == "list.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "list.item" and event == "end_map":
+                    items.append(builder.value)
+                    builder = None
+            elif prefix == "city.name":
+                city_name = value
+    except ijson.JSONError as e:  # Not a ValueError subclass, unlike the other decoders
+        raise WeatherAPIError(f"Invalid JSON in API response: {e}") from e
+    return {"list": items, "city": {"name": city_name}}
+
+
+def _parse_forecast_items(items: List[dict], city_name: str) -> List[WeatherData]:
+    """Convert the "list" entries of a /forecast response into WeatherData objects.
+
+    This is the hot loop of forecast parsing. It is kept as a fully annotated,
+    module-level function with no dependence on instance state so that it can be
+    compiled ahead of time (e.g. with mypyc) without changing any callers.
+
+    Args:
+        items (List[dict]): The forecast entries from the decoded response.
+        city_name (str): The city name shared by every entry.
+
+    Returns:
+        List[WeatherData]: One WeatherData object per 3-hour forecast interval.
+    """
+    # Bind the timestamp helper locally to avoid a global lookup per row.
+    _to_dt = _ts_to_dt
+    return [
+        WeatherData(
+            city_name=city_name,
+            temperature=it["main"]["temp"],
+            condition=it["weather"][0]["description"],
+            humidity=it["main"]["humidity"],
+            wind_speed=it["wind"]["speed"],
+            timestamp=_to_dt(it["dt"])
+        )
+        for it in items
+    ]
+
+
 class WeatherAPIError(Exception):
     """Custom exception raised for errors encountered while interacting with the OpenWeatherMap API.
 
-    This exception is used to wrap HTTP errors (excluding 404) and network-related issues,
-    providing a clear indication of API-specific problems.
+    This exception is used to wrap HTTP errors (excluding 404), malformed response bodies
+    and network-related issues, providing a clear indication of API-specific problems.
 
     Attributes:
         message (str): A description of the error (e.g., "HTTP error occurred: 500 Server Error").
@@ -22,37 +204,314 @@ class WeatherAPIService:
     Attributes:
         api_key (str): The API key required for authenticating requests to OpenWeatherMap.
         base_url (str): The base URL for the OpenWeatherMap API (version 2.5).
+        session (requests.Session): The process-wide HTTP session that reuses connections
+                                    (keep-alive) across requests to the API.
+        stream_forecast (bool): Whether fetch_forecast decodes the response incrementally with ijson.
+                                Only the synchronous fetch_forecast honours it; afetch_forecast
+                                always decodes the whole body.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, stream_forecast: bool = False):
         """Initialize the WeatherAPIService with an API key.
 
         Args:
             api_key (str): The API key obtained from OpenWeatherMap for accessing weather data.
+            stream_forecast (bool): Decode forecast responses incrementally as they download
+                                    (requires ijson). This helps on slow, high-latency links; on
+                                    fast links the default whole-body decode is quicker. Only
+                                    the synchronous fetch_forecast streams; afetch_forecast
+                                    ignores this flag.
         """
+        if stream_forecast and ijson is None:
+            raise ImportError("stream_forecast=True requires the ijson package")
         self.api_key = api_key
-        self.base_url = "http://api.openweathermap.org/data/2.5"
+        self.stream_forecast = stream_forecast
+        self.base_url = "https://api.openweathermap.org/data/2.5"
+        self._weather_url = f"{self.base_url}/weather"
+        self._forecast_url = f"{self.base_url}/forecast"
+        # Shared query parameters; "units=metric" makes the API return temperatures in Celsius.
+        # Kept as a tuple of pairs so each request only concatenates the city onto it.
+        self._params_base = (("appid", api_key), ("units", "metric"))
+        self._cache = _CACHE  # Shared by all instances; writes go through _CACHE_LOCK
+
+    @property
+    def session(self) -> requests.Session:
+        """requests.Session: The shared HTTP session used for synchronous requests."""
+        return _get_session()
 
-    def _kelvin_to_celsius(self, kelvin: float) -> float:
-        """Convert a temperature from Kelvin to Celsius.
+    def clear_cache(self) -> None:
+        """Discard every cached response shared by WeatherAPIService instances and reset the statistics."""
+        with _CACHE_LOCK:
+            self._cache.clear()
+            _CACHE_STATS["hits"] = _CACHE_STATS["misses"] = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Report how effective the shared response cache has been.
+
+        A hit is a lookup answered from a fresh entry without any HTTP request;
+        a miss covers both absent and expired entries.
+
+        Returns:
+            CacheInfo: The hit and miss counts, the size bound and the number of cached entries.
+        """
+        with _CACHE_LOCK:
+            return CacheInfo(_CACHE_STATS["hits"], _CACHE_STATS["misses"], _CACHE_MAXSIZE, len(self._cache))
 
-        This is a private helper method used internally to transform the temperature
-        values returned by the OpenWeatherMap API (in Kelvin) to Celsius.
+    def _cache_get(self, key: Tuple[str, str], ttl: float):
+        """Return a cached value if it is younger than `ttl` seconds, otherwise None.
 
         Args:
-            kelvin (float): The temperature in Kelvin.
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+            ttl (float): The freshness window in seconds.
+        """
+        with _CACHE_LOCK:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                _CACHE_STATS["hits"] += 1
+                return entry[1]
+            _CACHE_STATS["misses"] += 1
+        return None
+
+    def _cache_put(
+        self, key: Tuple[str, str], value, last_modified: Optional[str] = None, etag: Optional[str] = None
+    ) -> None:
+        """Store a value in the response cache, stamped with the current time.
+
+        Once the cache holds more than _CACHE_MAXSIZE entries, the least recently
+        stored ones are evicted.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+            value: The parsed result to cache.
+            last_modified (Optional[str]): The response's Last-Modified header, if any.
+            etag (Optional[str]): The response's ETag header, if any.
+        """
+        with _CACHE_LOCK:
+            self._cache[key] = (time.monotonic(), value, last_modified, etag)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+
+    def _conditional_headers(self, key: Tuple[str, str]) -> Dict[str, str]:
+        """Build If-Modified-Since / If-None-Match headers from a cached entry.
+
+        Sending these lets the API answer with 304 Not Modified and no body when
+        the data has not changed since it was cached.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+
+        Returns:
+            Dict[str, str]: The validator headers, or an empty dict if nothing is cached.
+        """
+        headers = {}
+        with _CACHE_LOCK:
+            entry = self._cache.get(key)
+        if entry is not None:
+            if entry[2]:
+                headers["If-Modified-Since"] = entry[2]
+            if entry[3]:
+                headers["If-None-Match"] = entry[3]
+        return headers
+
+    def _revalidate(self, key: Tuple[str, str], headers) -> object:
+        """Mark a cached entry as fresh again after a 304 response and return its value.
+
+        Validators sent with the 304 response replace the stored ones.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+            headers: The headers of the 304 response.
+
+        Raises:
+            WeatherAPIError: If the entry is no longer cached (e.g. after a concurrent clear_cache()).
+        """
+        with _CACHE_LOCK:
+            entry = self._cache.get(key)
+            if entry is None:
+                raise WeatherAPIError("Received 304 Not Modified but no cached response is available")
+            _, value, last_modified, etag = entry
+            self._cache[key] = (
+                time.monotonic(),
+                value,
+                headers.get("Last-Modified") or last_modified,
+                headers.get("ETag") or etag
+            )
+            self._cache.move_to_end(key)
+        return value
+
+    def _stale_or_raise(self, key: Tuple[str, str], error: WeatherAPIError):
+        """Fall back to a stale cached value when a request fails.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+            error (WeatherAPIError): The error to raise if nothing is cached.
 
         Returns:
-            float: The temperature in Celsius, calculated as Kelvin - 273.15.
+            The previously cached value for `key`, regardless of its age.
+
+        Raises:
+            WeatherAPIError: If no cached value exists for `key`.
         """
-        return kelvin - 273.15
+        with _CACHE_LOCK:
+            entry = self._cache.get(key)
+        if entry is None:
+            raise error
+        logger.warning("%s; serving stale cached data for %s", error, key[1])
+        return entry[1]
+
+    def _parse_current(self, data: dict) -> WeatherData:
+        """Convert a decoded /weather response into a WeatherData object.
+
+        Args:
+            data (dict): The decoded JSON body of a /weather response.
+
+        Returns:
+            WeatherData: The current weather details.
+        """
+        return WeatherData(
+            city_name=data["name"],
+            temperature=data["main"]["temp"],
+            condition=data["weather"][0]["description"],
+            humidity=data["main"]["humidity"],
+            wind_speed=data["wind"]["speed"],
+            timestamp=_ts_to_dt(data["dt"])
+        )
+
+    def _parse_forecast(self, data: dict) -> List[WeatherData]:
+        """Convert a decoded /forecast response into a list of WeatherData objects.
+
+        Args:
+            data (dict): The decoded JSON body of a /forecast response.
+
+        Returns:
+            List[WeatherData]: One WeatherData object per 3-hour forecast interval.
+        """
+        return _parse_forecast_items(data["list"], data["city"]["name"])
+
+    def _read_current(self, response) -> WeatherData:
+        """Decode a successful /weather response into a WeatherData object."""
+        return self._parse_current(_decode_json(response))
+
+    def _read_forecast(self, response) -> Tuple[WeatherData, ...]:
+        """Decode a successful /forecast response into a tuple of WeatherData objects.
+
+        A tuple is returned so that the shared cache never holds a list a caller could mutate.
+        """
+        return tuple(self._parse_forecast(_decode_json(response)))
+
+    def _read_forecast_stream(self, response: requests.Response) -> Tuple[WeatherData, ...]:
+        """Decode a streamed /forecast response incrementally with ijson, as a tuple like _read_forecast."""
+        response.raw.decode_content = True  # Undo any gzip transfer encoding
+        return tuple(self._parse_forecast(_stream_forecast_data(response.raw)))
+
+    def _request_kwargs(self, key: Tuple[str, str], city: str) -> dict:
+        """Build the keyword arguments shared by every API request.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key, used for conditional GET validators.
+            city (str): The city to query.
+
+        Returns:
+            dict: The query parameters, conditional headers and timeout.
+        """
+        return {
+            "params": (("q", city),) + self._params_base,
+            "headers": self._conditional_headers(key),
+            "timeout": 5
+        }
+
+    def _handle_response(self, key: Tuple[str, str], response, read: Callable, not_found):
+        """Turn an API response into a result, updating the cache.
+
+        Shared by the requests-based and httpx-based fetch methods, which differ only
+        in how the request is sent and which network errors they catch.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+            response (requests.Response | httpx.Response): The API response.
+            read (Callable): Decodes a successful response into the result.
+            not_found: The value returned when the city is not found (HTTP 404).
+
+        Returns:
+            The decoded result, the revalidated cached result for a 304, or `not_found`.
+
+        Raises:
+            WeatherAPIError: For other error status codes, a malformed body, or a 304
+                             with nothing cached.
+        """
+        if response.status_code == 404:
+            return not_found  # City not found
+        if response.status_code == 304:
+            return self._revalidate(key, response.headers)  # Unchanged since cached; skip parsing
+        try:
+            response.raise_for_status()  # Raises for other error status codes
+        except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as e:
+            raise WeatherAPIError(f"HTTP error occurred: {e}") from e
+        result = read(response)
+        self._cache_put(key, result, response.headers.get("Last-Modified"), response.headers.get("ETag"))
+        return result
+
+    def _fetch(self, key: Tuple[str, str], ttl: float, url: str, city: str, read: Callable, not_found,
+               description: str, stream: bool = False):
+        """Fetch a result through the shared session: cache, conditional GET, then stale fallback.
+
+        Args:
+            key (Tuple[str, str]): The (endpoint, city) cache key.
+            ttl (float): The freshness window for cached results, in seconds.
+            url (str): The endpoint URL.
+            city (str): The city to query.
+            read (Callable): Decodes a successful response into the result.
+            not_found: The value returned when the city is not found (HTTP 404).
+            description (str): What is being fetched, used in network error messages.
+            stream (bool): Whether to stream the response body.
+
+        Raises:
+            WeatherAPIError: If the request fails and no cached result is available.
+        """
+        cached = self._cache_get(key, ttl=ttl)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.session.get(url, stream=stream, **self._request_kwargs(key, city))
+            # Closing matters when streaming: an unread body otherwise holds its pooled connection.
+            with closing(response):
+                return self._handle_response(key, response, read, not_found)
+        except WeatherAPIError as e:
+            return self._stale_or_raise(key, e)
+        except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+            # urllib3 errors can surface while reading a streamed body
+            return self._stale_or_raise(key, WeatherAPIError(f"Error fetching {description} data: {e}"))
+
+    async def _afetch(self, client: httpx.AsyncClient, key: Tuple[str, str], ttl: float, url: str, city: str,
+                      read: Callable, not_found, description: str):
+        """Asynchronous counterpart of _fetch, sending the request through an httpx.AsyncClient.
+
+        Raises:
+            WeatherAPIError: If the request fails and no cached result is available.
+        """
+        cached = self._cache_get(key, ttl=ttl)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await client.get(url, **self._request_kwargs(key, city))
+            return self._handle_response(key, response, read, not_found)
+        except WeatherAPIError as e:
+            return self._stale_or_raise(key, e)
+        except httpx.HTTPError as e:
+            return self._stale_or_raise(key, WeatherAPIError(f"Error fetching {description} data: {e}"))
 
     def fetch_current_weather(self, city: str) -> Optional[WeatherData]:
         """Fetch the current weather data for a specified city.
 
         This method sends a request to the OpenWeatherMap API's /weather endpoint,
         retrieves the current weather data, and returns it as a WeatherData object.
-        If the city is not found (HTTP 404), it returns None.
+        If the city is not found (HTTP 404), it returns None. Results are cached for
+        CURRENT_WEATHER_TTL seconds, and a stale cached result is returned if a later
+        request fails. Expired entries are revalidated with a conditional GET, so an
+        unchanged result (HTTP 304) is reused without downloading or parsing a body.
 
         Args:
             city (str): The name of the city for which to fetch weather data (e.g., "London").
@@ -62,28 +521,13 @@ class WeatherAPIService:
                                   or None if the city is not found.
 
         Raises:
-            WeatherAPIError: If an HTTP error (other than 404) or a network error occurs during the request.
+            WeatherAPIError: If an HTTP error (other than 404) or a network error occurs during the request
+                             and no cached result is available.
         """
-        url = f"{self.base_url}/weather?q={city}&appid={self.api_key}"
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()  # Raises HTTPError for non-200 status codes
-            data = response.json()
-
-            return WeatherData(
-                city_name=data["name"],
-                temperature=round(self._kelvin_to_celsius(data["main"]["temp"]), 1),
-                condition=data["weather"][0]["description"],
-                humidity=data["main"]["humidity"],
-                wind_speed=data["wind"]["speed"],
-                timestamp=datetime.fromtimestamp(data["dt"], timezone.utc)
-            )
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                return None  # City not found
-            raise WeatherAPIError(f"HTTP error occurred: {e}")
-        except requests.exceptions.RequestException as e:
-            raise WeatherAPIError(f"Error fetching weather data: {e}")
+        return self._fetch(
+            ("cur", city.casefold()), CURRENT_WEATHER_TTL, self._weather_url, city,
+            read=self._read_current, not_found=None, description="weather"
+        )
 
     def fetch_forecast(self, city: str) -> List[WeatherData]:
         """Fetch a 5-day weather forecast for a specified city, with 3-hour intervals.
@@ -91,7 +535,9 @@ class WeatherAPIService:
         This method queries the OpenWeatherMap API's /forecast endpoint to retrieve
         weather data for the next 5 days, sampled every 3 hours. Each forecast point
         is returned as a WeatherData object in a list. If the city is not found (HTTP 404),
-        an empty list is returned.
+        an empty list is returned. Results are cached for FORECAST_TTL seconds, and a
+        stale cached result is returned if a later request fails. Expired entries are
+        revalidated with a conditional GET, as in fetch_current_weather.
 
         Args:
             city (str): The name of the city for which to fetch the forecast (e.g., "London").
@@ -101,28 +547,60 @@ class WeatherAPIService:
                               forecast interval over 5 days, or an empty list if the city is not found.
 
         Raises:
-            WeatherAPIError: If an HTTP error (other than 404) or a network error occurs during the request.
+            WeatherAPIError: If an HTTP error (other than 404) or a network error occurs during the request
+                             and no cached result is available.
         """
-        url = f"{self.base_url}/forecast?q={city}&appid={self.api_key}"
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()  # Raises HTTPError for non-200 status codes
-            data = response.json()
-
-            forecast_list = []
-            for item in data["list"]:
-                forecast_list.append(WeatherData(
-                    city_name=data["city"]["name"],
-                    temperature=round(self._kelvin_to_celsius(item["main"]["temp"]), 1),
-                    condition=item["weather"][0]["description"],
-                    humidity=item["main"]["humidity"],
-                    wind_speed=item["wind"]["speed"],
-                    timestamp=datetime.fromtimestamp(item["dt"], timezone.utc)
-                ))
-            return forecast_list
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                return []  # City not found
-            raise WeatherAPIError(f"HTTP error occurred: {e}")
-        except requests.exceptions.RequestException as e:
-            raise WeatherAPIError(f"Error fetching forecast data: {e}")
\ No newline at end of file
+        # Cached forecasts are tuples shared process-wide; each caller gets its own list.
+        return list(self._fetch(
+            ("fc", city.casefold()), FORECAST_TTL, self._forecast_url, city,
+            read=self._read_forecast_stream if self.stream_forecast else self._read_forecast,
+            not_found=(), description="forecast", stream=self.stream_forecast
+        ))
+
+    async def afetch_current_weather(self, client: httpx.AsyncClient, city: str) -> Optional[WeatherData]:
+        """Asynchronously fetch the current weather data for a specified city.
+
+        Behaves like fetch_current_weather, including caching and the stale fallback,
+        but issues the request through an httpx.AsyncClient so that many cities can be
+        fetched concurrently.
+
+        Args:
+            client (httpx.AsyncClient): The async HTTP client used to send the request.
+            city (str): The name of the city for which to fetch weather data (e.g., "London").
+
+        Returns:
+            Optional[WeatherData]: A WeatherData object containing the current weather details,
+                                  or None if the city is not found.
+
+        Raises:
+            WeatherAPIError: If an HTTP error (other than 404) or a network error occurs during the request
+                             and no cached result is available.
+        """
+        return await self._afetch(
+            client, ("cur", city.casefold()), CURRENT_WEATHER_TTL, self._weather_url, city,
+            read=self._read_current, not_found=None, description="weather"
+        )
+
+    async def afetch_forecast(self, client: httpx.AsyncClient, city: str) -> List[WeatherData]:
+        """Asynchronously fetch a 5-day weather forecast for a specified city.
+
+        Behaves like fetch_forecast, including caching and the stale fallback, but
+        issues the request through an httpx.AsyncClient. The stream_forecast flag is
+        not applied here: the response body is always decoded in one piece.
+
+        Args:
+            client (httpx.AsyncClient): The async HTTP client used to send the request.
+            city (str): The name of the city for which to fetch the forecast (e.g., "London").
+
+        Returns:
+            List[WeatherData]: A list of WeatherData objects, each representing a 3-hour
+                              forecast interval over 5 days, or an empty list if the city is not found.
+
+        Raises:
+            WeatherAPIError: If an HTTP error (other than 404) or a network error occurs during the request
+                             and no cached result is available.
+        """
+        return list(await self._afetch(
+            client, ("fc", city.casefold()), FORECAST_TTL, self._forecast_url, city,
+            read=self._read_forecast, not_found=(), description="forecast"
+        ))
@@ -1,9 +1,7 @@
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
-@dataclass
-class WeatherData:
+class WeatherData(NamedTuple):
     city_name: str
     temperature: float
     condition: str
@@ -11,15 +9,16 @@ class WeatherData:
     wind_speed: float
     timestamp: Optional[datetime] = None
 
-"""This is a data class that represents weather information for a specific city at a given time.
+"""This is a named tuple that represents weather information for a specific city at a given time.
 
-    This class uses the `@dataclass` decorator to automatically generate an initializer,
-    string representation, and equality comparison methods. It structures weather data
+    This class uses `typing.NamedTuple` to provide an initializer, string representation,
+    and equality comparison methods. Instances are built and accessed at C speed, and are
+    small, immutable and hashable. It structures weather data
     fetched from the OpenWeatherMap API, as processed by the WeatherAPIService class.
 
     Attributes:
         city_name (str): The name of the city (e.g., "London", "New York").
-        temperature (float): The temperature in Celsius, typically rounded to one decimal place.
+        temperature (float): The temperature in Celsius, as returned by the API (displayed to one decimal place).
         condition (str): A brief description of the weather (e.g., "clear sky", "light rain").
         humidity (int): The relative humidity as a percentage (e.g., 80 for 80%).
         wind_speed (float): The wind speed in meters per second (m/s).
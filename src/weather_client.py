@@ -1,9 +1,34 @@
+import asyncio
+import functools
 import os
+import sys
+import httpx
 from dotenv import load_dotenv
-from typing import List
-from api_service import WeatherAPIService, WeatherAPIError
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+from api_service import WeatherAPIService, WeatherAPIError, close_session
 from models import WeatherData
 
+# Pre-built output templates so each weather block is emitted with a single write.
+_TPL = (
+    "\nWeather for {name}:\n"
+    "Temperature: {t:.1f}°C\n"
+    "Condition: {c}\n"
+    "Humidity: {h}%\n"
+    "Wind Speed: {w} m/s\n"
+)
+_TIME_TPL = "Time: {ts} UTC\n"
+_SEPARATOR = "-" * 40 + "\n"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ts(dt: datetime) -> str:
+    """Return the display string for a timestamp; repeated queries reuse earlier results."""
+    # isoformat is implemented in C and skips strftime's format parsing; dropping
+    # tzinfo keeps the "+00:00" offset out of the output for aware datetimes.
+    return dt.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+
+
 class WeatherClient:
     """This is a client class for interacting with weather data and displaying it to the user.
 
@@ -35,19 +60,34 @@ class WeatherClient:
         Returns:
             None: This method only prints to the console and does not return a value.
         """
-        print(f"\nWeather for {weather.city_name}:")
-        print(f"Temperature: {weather.temperature}°C")
-        print(f"Condition: {weather.condition}")
-        print(f"Humidity: {weather.humidity}%")
-        print(f"Wind Speed: {weather.wind_speed} m/s")
+        sys.stdout.write(self._format_weather(weather))
+
+    def _format_weather(self, weather: WeatherData) -> str:
+        """Render a WeatherData object as the text block printed by display_weather.
+
+        Args:
+            weather (WeatherData): The weather information to render.
+
+        Returns:
+            str: The formatted block, ending with a newline.
+        """
+        text = _TPL.format(
+            name=weather.city_name,
+            t=weather.temperature,
+            c=weather.condition,
+            h=weather.humidity,
+            w=weather.wind_speed
+        )
         if weather.timestamp:
-            print(f"Time: {weather.timestamp.strftime('%Y-%m-%d %H:%M:%S')} UTC")  # Updated to UTC
+            text += _TIME_TPL.format(ts=_fmt_ts(weather.timestamp))  # Always UTC
+        return text
 
     def display_forecast(self, forecast: List[WeatherData]) -> None:
         """Display a 5-day weather forecast for a city, with 3-hour intervals.
 
         Prints a header with the city name followed by the weather details for each
-        3-hour forecast interval over 5 days, separated by dashed lines.
+        3-hour forecast interval over 5 days, separated by dashed lines. The whole
+        forecast is assembled first and written to the console in one call.
 
         Args:
             forecast (List[WeatherData]): A list of WeatherData objects representing the forecast.
@@ -55,71 +95,173 @@ class WeatherClient:
         Returns:
             None: This method only prints to the console and does not return a value.
         """
-        print(f"\n5-Day Forecast for {forecast[0].city_name}:")
-        for weather in forecast:
-            print("-" * 40)
-            self.display_weather(weather)
+        _format = self._format_weather
+        sys.stdout.write("".join(
+            [f"\n5-Day Forecast for {forecast[0].city_name}:\n"]
+            + [_SEPARATOR + _format(weather) for weather in forecast]
+        ))
+
+    def _make_async_client(self) -> httpx.AsyncClient:
+        """Create the pooled async HTTP client used by get_weather_for_cities.
+
+        The API is served over HTTPS, so HTTP/2 can be negotiated via TLS ALPN;
+        httpx falls back to HTTP/1.1 if the server does not offer it.
+
+        Returns:
+            httpx.AsyncClient: A new client; the caller is responsible for closing it.
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+            timeout=30.0
+        )
+
+    def _parse_cities(self, user_input: str) -> List[str]:
+        """Split comma-separated user input into a list of unique city names.
+
+        Surrounding and repeated inner whitespace is collapsed, empty names are
+        skipped, and duplicates are dropped case-insensitively (keeping the first
+        spelling), so "London, london ,  LONDON" is fetched only once.
+
+        Args:
+            user_input (str): The raw line entered by the user.
+
+        Returns:
+            List[str]: The canonical city names, in the order first entered.
+        """
+        seen = set()
+        cities = []
+        for token in user_input.split(","):
+            city = " ".join(token.split())
+            key = city.casefold()
+            if city and key not in seen:
+                seen.add(key)
+                cities.append(city)
+        return cities
+
+    async def _fetch_all(
+        self, client: httpx.AsyncClient, cities: List[str]
+    ) -> List[Tuple[Union[Optional[WeatherData], BaseException], Union[List[WeatherData], BaseException]]]:
+        """Concurrently fetch the current weather and forecast for every city.
+
+        Both endpoints for all cities are requested at once, so the total wait is
+        roughly one round trip rather than two per city. Each request's outcome is
+        kept separately, so a failing forecast does not discard the current weather
+        (or vice versa).
+
+        Args:
+            client (httpx.AsyncClient): The async HTTP client shared by all requests.
+            cities (List[str]): The city names to fetch.
+
+        Returns:
+            List: One (current_weather, forecast) pair per city, where either element may
+                  instead be the exception raised while fetching it.
+        """
+        service = self.api_service
+        results = await asyncio.gather(
+            *[
+                fetch(client, city)
+                for city in cities
+                for fetch in (service.afetch_current_weather, service.afetch_forecast)
+            ],
+            return_exceptions=True
+        )
+        return list(zip(results[0::2], results[1::2]))
+
+    def _report_error(self, error: BaseException) -> None:
+        """Print an error raised while fetching one endpoint for a city.
+
+        Args:
+            error (BaseException): The exception captured by _fetch_all.
+
+        Returns:
+            None: This method only prints to the console and does not return a value.
+        """
+        if isinstance(error, WeatherAPIError):
+            print(f"Error: {error}")
+        else:
+            print(f"Unexpected error: {error}")
 
     def get_weather_for_cities(self) -> None:
         """Interact with the user to fetch and display weather data for multiple cities.
 
         Prompts the user to enter city names (comma-separated) or "quit" to exit.
         For each valid city, it fetches and displays the current weather and 5-day forecast.
-        Handles errors gracefully, including city not found, API errors, and user interrupts.
+        All cities in a single input are fetched concurrently over a pooled HTTPS client, which
+        uses HTTP/2 when the server negotiates it.
+        Handles errors gracefully, including city not found, API errors, and user interrupts;
+        a failure on one endpoint is reported without hiding the other endpoint's result.
+        The async HTTP client is closed when the loop exits.
 
         Returns:
             None: This method runs an interactive loop and prints to the console.
 
         """
         print("Enter city names (separated by commas) or 'quit' to exit.")
-        while True:
-            try:
-                user_input = input("Cities: ").strip()
-                if user_input.lower() == "quit":
-                    print("Exiting...")
-                    break
+        # A single event loop is reused for every input so the async client's
+        # pooled connections survive between prompts.
+        loop = asyncio.new_event_loop()
+        client = self._make_async_client()
+        try:
+            while True:
+                try:
+                    user_input = input("Cities: ").strip()
+                    if user_input.lower() == "quit":
+                        print("Exiting...")
+                        break
 
-                cities = [city.strip() for city in user_input.split(",")]
-
-                for city in cities:
-                    if not city:
-                        continue  # Skip empty city names
-
-                    print(f"\nFetching weather for {city}...")
-                    # Fetch and display current weather
-                    current_weather = self.api_service.fetch_current_weather(city)
-                    if current_weather:
-                        self.display_weather(current_weather)
-                    else:
-                        print(f"City '{city}' not found.")
-
-                    # Fetch and display forecast
-                    forecast = self.api_service.fetch_forecast(city)
-                    if forecast:
-                        self.display_forecast(forecast)
-                    else:
-                        print(f"No forecast available for '{city}'.")
-
-            except WeatherAPIError as e:
-                print(f"Error: {e}")
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except Exception as e:
-                print(f"Unexpected error: {e}")
+                    cities = self._parse_cities(user_input)
+                    if not cities:
+                        continue  # Nothing but separators or whitespace
+
+                    print(f"\nFetching weather for {', '.join(cities)}...")
+                    results = loop.run_until_complete(self._fetch_all(client, cities))
+
+                    for city, (current_weather, forecast) in zip(cities, results):
+                        print(f"\nWeather results for {city}:")
+                        # Display current weather
+                        if isinstance(current_weather, BaseException):
+                            self._report_error(current_weather)
+                        elif current_weather:
+                            self.display_weather(current_weather)
+                        else:
+                            print(f"City '{city}' not found.")
+
+                        # Display forecast
+                        if isinstance(forecast, BaseException):
+                            self._report_error(forecast)
+                        elif forecast:
+                            self.display_forecast(forecast)
+                        else:
+                            print(f"No forecast available for '{city}'.")
+
+                except WeatherAPIError as e:
+                    print(f"Error: {e}")
+                except KeyboardInterrupt:
+                    print("\nExiting...")
+                    break
+                except Exception as e:
+                    print(f"Unexpected error: {e}")
+        finally:
+            loop.run_until_complete(client.aclose())
+            loop.close()
 
 def main():
     """Entry point for the weather client application.
 
     Loads the API key from the environment (optionally from a .env file),
     initializes the WeatherClient, and starts the interactive weather retrieval loop.
+    The shared HTTP session is closed on exit.
     """
     load_dotenv()  # Load environment variables from .env file
     API_KEY = os.getenv("WEATHER_API_KEY")
     if not API_KEY:
         raise ValueError("Please set the WEATHER_API_KEY environment variable or include it in a .env file.")
     client = WeatherClient(API_KEY)
-    client.get_weather_for_cities()
+    try:
+        client.get_weather_for_cities()
+    finally:
+        close_session()  # The process owns the HTTP session shared by all API services
 
 if __name__ == "__main__":
     """Run the main function if this script is executed directly."""
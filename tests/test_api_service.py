@@ -1,7 +1,12 @@
+import asyncio
+import io
+import json
+import time
+import httpx
 import pytest
 import requests
 from unittest.mock import Mock, patch
-from src.api_service import WeatherAPIService, WeatherAPIError
+from src.api_service import WeatherAPIService, WeatherAPIError, CURRENT_WEATHER_TTL, close_session
 from models import WeatherData
 import os
 from dotenv import load_dotenv
@@ -16,7 +21,7 @@ def weather_service():
     """Provide a WeatherAPIService instance for testing.
 
     This fixture initializes a WeatherAPIService object using an API key loaded from
-    the environment variable
+    the environment variable, starting from an empty response cache.
 
     Returns:
         WeatherAPIService: An instance of WeatherAPIService configured with the API key.
@@ -24,7 +29,9 @@ def weather_service():
     api_key = os.getenv("WEATHER_API_KEY")
     if not api_key:
         raise ValueError("WEATHER_API_KEY not found in environment or .env file")
-    return WeatherAPIService(api_key=api_key)
+    service = WeatherAPIService(api_key=api_key)
+    service.clear_cache()  # The response cache is shared process-wide
+    return service
 
 # --- Tests for fetch_current_weather ---
 
@@ -40,14 +47,14 @@ def test_fetch_current_weather_success(weather_service):
     """
     mock_response = {
         "name": "London",
-        "main": {"temp": 283.15, "humidity": 80},
+        "main": {"temp": 10.0, "humidity": 80},
         "weather": [{"description": "clear sky"}],
         "wind": {"speed": 5.0},
         "dt": 1635778800  # Unix timestamp for 2021-11-01 15:00:00 UTC
     }
-    with patch("requests.get") as mock_get:
+    with patch.object(weather_service.session, "get") as mock_get:
         # Configure the mock to return a successful response
-        mock_get.return_value = Mock(status_code=200)
+        mock_get.return_value = Mock(status_code=200, content=json.dumps(mock_response).encode(), headers={})
         mock_get.return_value.json.return_value = mock_response
 
         result = weather_service.fetch_current_weather("London")
@@ -55,10 +62,13 @@ def test_fetch_current_weather_success(weather_service):
         # Assertions to verify the returned WeatherData object
         assert isinstance(result, WeatherData), "Result should be a WeatherData instance"
         assert result.city_name == "London", "City name should match input"
-        assert result.temperature == pytest.approx(10.0, 0.1), "Temperature should be ~10°C (from 283.15K)"
+        assert result.temperature == pytest.approx(10.0, 0.1), "Temperature should be ~10°C"
         assert result.condition == "clear sky", "Condition should match API response"
         assert result.humidity == 80, "Humidity should match API response"
         assert result.wind_speed == 5.0, "Wind speed should match API response"
+        params = dict(mock_get.call_args.kwargs["params"])
+        assert params["q"] == "London", "City should be passed as a query parameter"
+        assert params["units"] == "metric", "Temperatures should be requested in Celsius"
 
 def test_fetch_current_weather_city_not_found(weather_service):
     """Test fetch_current_weather when the city is not found (404 error).
@@ -69,7 +79,7 @@ def test_fetch_current_weather_city_not_found(weather_service):
     Args:
         weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
     """
-    with patch("requests.get") as mock_get:
+    with patch.object(weather_service.session, "get") as mock_get:
         # Configure the mock to simulate a 404 error
         mock_response = Mock(status_code=404)
         mock_response.json.return_value = {"message": "city not found"}
@@ -79,6 +89,7 @@ def test_fetch_current_weather_city_not_found(weather_service):
         result = weather_service.fetch_current_weather("InvalidCity")
 
         assert result is None, "Result should be None for a 404 error"
+        mock_response.raise_for_status.assert_not_called()
 
 def test_fetch_current_weather_http_error(weather_service):
     """Test fetch_current_weather with a server error (500 status).
@@ -89,7 +100,7 @@ def test_fetch_current_weather_http_error(weather_service):
     Args:
         weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
     """
-    with patch("requests.get") as mock_get:
+    with patch.object(weather_service.session, "get") as mock_get:
         # Configure the mock to simulate a 500 error
         mock_response = Mock(status_code=500)
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
@@ -98,6 +109,33 @@ def test_fetch_current_weather_http_error(weather_service):
         with pytest.raises(WeatherAPIError):
             weather_service.fetch_current_weather("London")
 
+def test_fetch_current_weather_malformed_body(weather_service):
+    """Test that a 200 response with a non-JSON body raises WeatherAPIError.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=200, content=b"<html>", headers={})
+        mock_get.return_value.json.side_effect = requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+
+        with pytest.raises(WeatherAPIError):
+            weather_service.fetch_current_weather("London")
+
+def test_fetch_current_weather_malformed_body_stale_fallback(weather_service):
+    """Test that a malformed body falls back to stale cached data like other API errors.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    stale = WeatherData(city_name="London", temperature=10.0, condition="clear sky", humidity=80, wind_speed=5.0)
+    weather_service._cache[("cur", "london")] = (time.monotonic() - CURRENT_WEATHER_TTL - 1, stale, None, None)
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=200, content=b"<html>", headers={})
+        mock_get.return_value.json.side_effect = requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+
+        assert weather_service.fetch_current_weather("London") == stale, "Stale data should be returned"
+
 # --- Tests for fetch_forecast ---
 
 def test_fetch_forecast_success(weather_service):
@@ -114,16 +152,16 @@ def test_fetch_forecast_success(weather_service):
         "city": {"name": "London"},
         "list": [
             {
-                "main": {"temp": 283.15, "humidity": 80},
+                "main": {"temp": 10.0, "humidity": 80},
                 "weather": [{"description": "clear sky"}],
                 "wind": {"speed": 5.0},
                 "dt": 1635778800  # Unix timestamp for 2021-11-01 15:00:00 UTC
             }
         ]
     }
-    with patch("requests.get") as mock_get:
+    with patch.object(weather_service.session, "get") as mock_get:
         # Configure the mock to return a successful response
-        mock_get.return_value = Mock(status_code=200)
+        mock_get.return_value = Mock(status_code=200, content=json.dumps(mock_response).encode(), headers={})
         mock_get.return_value.json.return_value = mock_response
 
         result = weather_service.fetch_forecast("London")
@@ -132,4 +170,269 @@ def test_fetch_forecast_success(weather_service):
         assert len(result) == 1, "Forecast list should contain one item"
         assert isinstance(result[0], WeatherData), "First item should be a WeatherData instance"
         assert result[0].city_name == "London", "City name should match input"
-        assert result[0].temperature == pytest.approx(10.0, 0.1), "Temperature should be ~10°C (from 283.15K)"
\ No newline at end of file
+        assert result[0].temperature == pytest.approx(10.0, 0.1), "Temperature should be ~10°C"
+
+def test_fetch_forecast_streaming(weather_service):
+    """Test fetch_forecast with stream_forecast enabled, decoding the body incrementally.
+
+    The city name appears after the forecast entries, as in real API responses.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    pytest.importorskip("ijson")
+    body = {
+        "cnt": 1,
+        "list": [
+            {
+                "main": {"temp": 10.0, "humidity": 80},
+                "weather": [{"description": "clear sky"}],
+                "wind": {"speed": 5.0},
+                "dt": 1635778800
+            }
+        ],
+        "city": {"name": "London"}
+    }
+    weather_service.stream_forecast = True
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=200, raw=io.BytesIO(json.dumps(body).encode()), headers={})
+
+        result = weather_service.fetch_forecast("London")
+
+        assert mock_get.call_args.kwargs["stream"] is True, "Response should be requested as a stream"
+        assert len(result) == 1, "Forecast list should contain one item"
+        assert result[0].city_name == "London", "City name should be read after the entries"
+        assert isinstance(result[0].temperature, float), "Temperature should be decoded as a float"
+
+def test_fetch_forecast_streaming_closes_response(weather_service):
+    """Test that a streamed forecast response is closed even when its body is never read.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    weather_service.stream_forecast = True
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=404, headers={})
+
+        assert weather_service.fetch_forecast("InvalidCity") == [], "Result should be empty for a 404 error"
+        mock_get.return_value.close.assert_called_once()
+
+def test_fetch_forecast_streaming_malformed_body(weather_service):
+    """Test that a non-JSON body on the streaming path raises WeatherAPIError.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    pytest.importorskip("ijson")
+    weather_service.stream_forecast = True
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=200, raw=io.BytesIO(b"<html>"), headers={})
+
+        with pytest.raises(WeatherAPIError):
+            weather_service.fetch_forecast("London")
+
+# --- Tests for session handling ---
+
+def test_close_session_closes_shared_session(weather_service):
+    """Test that close_session releases the shared HTTP session and a new one is created on demand.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    session = weather_service.session
+    with patch.object(session, "close") as mock_close:
+        close_session()
+
+        mock_close.assert_called_once()
+    assert weather_service.session is not session, "A fresh session should be created after close"
+
+def test_session_and_cache_are_shared(weather_service):
+    """Test that separate WeatherAPIService instances share one session and one cache.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    other = WeatherAPIService(api_key="other-key")
+    assert other.session is weather_service.session, "Instances should share the pooled session"
+    weather_service._cache_put(("cur", "london"), "cached")
+    assert other._cache_get(("cur", "london"), ttl=CURRENT_WEATHER_TTL) == "cached", "Instances should share the cache"
+
+
+# --- Tests for response caching ---
+
+def test_fetch_forecast_cache_isolated_from_callers(weather_service):
+    """Test that mutating a returned forecast list does not corrupt the shared cache.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    mock_response = {
+        "city": {"name": "London"},
+        "list": [
+            {
+                "main": {"temp": 10.0, "humidity": 80},
+                "weather": [{"description": "clear sky"}],
+                "wind": {"speed": 5.0},
+                "dt": 1635778800
+            }
+        ]
+    }
+    other = WeatherAPIService(api_key="other-key")
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=200, content=json.dumps(mock_response).encode(), headers={})
+
+        weather_service.fetch_forecast("London").clear()
+        result = other.fetch_forecast("London")
+
+        assert mock_get.call_count == 1, "Second call should be served from the cache"
+        assert len(result) == 1, "Cached forecast should be unaffected by a caller's mutation"
+        other.fetch_forecast("London").clear()
+        assert len(weather_service.fetch_forecast("London")) == 1, "Cache hits should return fresh lists"
+
+def test_fetch_current_weather_uses_cache(weather_service):
+    """Test that repeated fetch_current_weather calls within the TTL are served from the cache.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    mock_response = {
+        "name": "London",
+        "main": {"temp": 10.0, "humidity": 80},
+        "weather": [{"description": "clear sky"}],
+        "wind": {"speed": 5.0},
+        "dt": 1635778800
+    }
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=200, content=json.dumps(mock_response).encode(), headers={})
+        mock_get.return_value.json.return_value = mock_response
+
+        first = weather_service.fetch_current_weather("London")
+        second = weather_service.fetch_current_weather("london")
+
+        assert mock_get.call_count == 1, "Second call should be served from the cache"
+        assert second == first, "Cached result should match the original"
+        info = weather_service.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1), "Cache statistics should count the hit and miss"
+
+def test_fetch_current_weather_stale_fallback(weather_service):
+    """Test that fetch_current_weather returns stale cached data when the API fails.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    stale = WeatherData(city_name="London", temperature=10.0, condition="clear sky", humidity=80, wind_speed=5.0)
+    weather_service._cache[("cur", "london")] = (time.monotonic() - CURRENT_WEATHER_TTL - 1, stale, None, None)
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
+
+        result = weather_service.fetch_current_weather("London")
+
+        mock_get.assert_called_once()
+        assert result == stale, "Stale cached data should be returned on error"
+
+
+def test_fetch_current_weather_not_modified(weather_service):
+    """Test that an expired entry is revalidated with a conditional GET and reused on 304.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    cached = WeatherData(city_name="London", temperature=10.0, condition="clear sky", humidity=80, wind_speed=5.0)
+    weather_service._cache[("cur", "london")] = (time.monotonic() - CURRENT_WEATHER_TTL - 1, cached, "Wed, 01 Nov 2023 12:00:00 GMT", '"abc"')
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=304, headers={"ETag": '"def"'})
+
+        result = weather_service.fetch_current_weather("London")
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-Modified-Since"] == "Wed, 01 Nov 2023 12:00:00 GMT", "Last-Modified should be sent back"
+        assert headers["If-None-Match"] == '"abc"', "ETag should be sent back"
+        assert result == cached, "Cached data should be reused on a 304 response"
+        assert weather_service._cache_get(("cur", "london"), ttl=CURRENT_WEATHER_TTL) == cached, "Entry should be fresh again"
+        assert weather_service._cache[("cur", "london")][3] == '"def"', "ETag from the 304 response should be stored"
+
+def test_fetch_current_weather_not_modified_without_cache(weather_service):
+    """Test that a 304 response with no cached entry raises WeatherAPIError instead of parsing an empty body.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    with patch.object(weather_service.session, "get") as mock_get:
+        mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+
+        with pytest.raises(WeatherAPIError):
+            weather_service.fetch_current_weather("London")
+
+def test_cache_evicts_least_recently_stored(weather_service, monkeypatch):
+    """Test that the shared cache stays within its size bound by evicting the oldest entries.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+        monkeypatch: Pytest fixture used to shrink the cache bound.
+    """
+    monkeypatch.setattr("src.api_service._CACHE_MAXSIZE", 2)
+    for city in ("london", "paris", "tokyo"):
+        weather_service._cache_put(("cur", city), city)
+
+    assert list(weather_service._cache) == [("cur", "paris"), ("cur", "tokyo")], "Oldest entry should be evicted"
+    assert weather_service.cache_info().currsize == 2, "Cache should not exceed its bound"
+
+# --- Tests for the async fetch methods ---
+
+def test_afetch_forecast_success(weather_service):
+    """Test afetch_forecast with a successful API response served by a mock transport.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    mock_response = {
+        "city": {"name": "London"},
+        "list": [
+            {
+                "main": {"temp": 10.0, "humidity": 80},
+                "weather": [{"description": "clear sky"}],
+                "wind": {"speed": 5.0},
+                "dt": 1635778800
+            }
+        ]
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=mock_response))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await weather_service.afetch_forecast(client, "London")
+
+    result = asyncio.run(run())
+
+    assert len(result) == 1, "Forecast list should contain one item"
+    assert result[0].city_name == "London", "City name should match input"
+    assert result[0].temperature == pytest.approx(10.0, 0.1), "Temperature should be ~10°C"
+
+def test_afetch_current_weather_city_not_found(weather_service):
+    """Test afetch_current_weather returns None when the API returns a 404 status.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    transport = httpx.MockTransport(lambda request: httpx.Response(404, json={"message": "city not found"}))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await weather_service.afetch_current_weather(client, "InvalidCity")
+
+    assert asyncio.run(run()) is None, "Result should be None for a 404 error"
+
+def test_afetch_forecast_malformed_body(weather_service):
+    """Test afetch_forecast raises WeatherAPIError for a 200 response with a non-JSON body.
+
+    Args:
+        weather_service (WeatherAPIService): The WeatherAPIService instance from the fixture.
+    """
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"<html>"))
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await weather_service.afetch_forecast(client, "London")
+
+    with pytest.raises(WeatherAPIError):
+        asyncio.run(run())
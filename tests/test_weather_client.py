@@ -1,7 +1,8 @@
+import httpx
 import pytest
 from src.weather_client import WeatherClient
 from models import WeatherData
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
 
@@ -78,4 +79,114 @@ def test_display_forecast(capsys, weather_client):
     weather_client.display_forecast(forecast)
     captured = capsys.readouterr()
     assert "5-Day Forecast for London" in captured.out, "Forecast header should include city name"
-    assert "Temperature: 10.0°C" in captured.out, "Temperature should appear in forecast output"
\ No newline at end of file
+    assert "Temperature: 10.0°C" in captured.out, "Temperature should appear in forecast output"
+
+def test_parse_cities_dedupes_input(weather_client):
+    """Test that _parse_cities drops empty names and case/whitespace duplicates.
+
+    Args:
+        weather_client (WeatherClient): The WeatherClient instance from the fixture.
+    """
+    cities = weather_client._parse_cities(" London, london ,, New  York,Paris, LONDON ")
+    assert cities == ["London", "New York", "Paris"], "Duplicates and empty names should be removed"
+
+def test_display_weather_aware_timestamp(capsys, weather_client):
+    """Test that a timezone-aware UTC timestamp is displayed without an offset suffix.
+
+    Args:
+        capsys: Pytest fixture to capture console output (stdout/stderr).
+        weather_client (WeatherClient): The WeatherClient instance from the fixture.
+    """
+    weather = WeatherData(
+        city_name="London",
+        temperature=10.0,
+        condition="clear sky",
+        humidity=80,
+        wind_speed=5.0,
+        timestamp=datetime(2023, 11, 1, 12, 0, 30, 500, tzinfo=timezone.utc)
+    )
+    weather_client.display_weather(weather)
+    captured = capsys.readouterr()
+    assert "Time: 2023-11-01 12:00:30 UTC" in captured.out, "Timestamp should be shown to the second in UTC"
+
+def test_get_weather_for_cities_mixed_results(capsys, monkeypatch, weather_client):
+    """Test get_weather_for_cities with one found, one missing and one failing city.
+
+    Serves the API from an httpx.MockTransport (200 for London, 404 for Nowhere,
+    500 for Broken) and feeds the interactive prompt from a list of inputs, checking
+    that each city's result or error is reported without affecting the others.
+
+    Args:
+        capsys: Pytest fixture to capture console output (stdout/stderr).
+        monkeypatch: Pytest fixture used to replace the input prompt and HTTP client.
+        weather_client (WeatherClient): The WeatherClient instance from the fixture.
+    """
+    def handler(request):
+        city = request.url.params["q"]
+        if city == "Nowhere":
+            return httpx.Response(404, json={"message": "city not found"})
+        if city == "Broken":
+            return httpx.Response(500, json={"message": "internal error"})
+        entry = {
+            "main": {"temp": 10.0, "humidity": 80},
+            "weather": [{"description": "clear sky"}],
+            "wind": {"speed": 5.0},
+            "dt": 1698840000
+        }
+        if request.url.path.endswith("/forecast"):
+            return httpx.Response(200, json={"list": [entry], "city": {"name": city}})
+        return httpx.Response(200, json={"name": city, **entry})
+
+    weather_client.api_service.clear_cache()
+    monkeypatch.setattr(
+        weather_client, "_make_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    inputs = iter(["London, Nowhere, Broken", "quit"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(inputs))
+
+    weather_client.get_weather_for_cities()
+    captured = capsys.readouterr()
+    assert "Weather for London" in captured.out, "Found city should be displayed"
+    assert "5-Day Forecast for London" in captured.out, "Found city's forecast should be displayed"
+    assert "City 'Nowhere' not found." in captured.out, "404 city should be reported as not found"
+    assert "No forecast available for 'Nowhere'." in captured.out, "404 city should have no forecast"
+    assert "Error: HTTP error occurred" in captured.out, "500 city should be reported as an API error"
+    assert "Exiting..." in captured.out, "Loop should exit on quit"
+
+def test_get_weather_for_cities_forecast_only_failure(capsys, monkeypatch, weather_client):
+    """Test get_weather_for_cities when only the forecast endpoint fails.
+
+    Serves /weather with 200 and /forecast with 500, checking that the current
+    weather is still displayed alongside the forecast error.
+
+    Args:
+        capsys: Pytest fixture to capture console output (stdout/stderr).
+        monkeypatch: Pytest fixture used to replace the input prompt and HTTP client.
+        weather_client (WeatherClient): The WeatherClient instance from the fixture.
+    """
+    def handler(request):
+        if request.url.path.endswith("/forecast"):
+            return httpx.Response(500, json={"message": "internal error"})
+        return httpx.Response(200, json={
+            "name": "London",
+            "main": {"temp": 10.0, "humidity": 80},
+            "weather": [{"description": "clear sky"}],
+            "wind": {"speed": 5.0},
+            "dt": 1698840000
+        })
+
+    weather_client.api_service.clear_cache()
+    monkeypatch.setattr(
+        weather_client, "_make_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    inputs = iter(["London", "quit"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(inputs))
+
+    weather_client.get_weather_for_cities()
+    captured = capsys.readouterr()
+    assert "Fetching weather for London..." in captured.out, "Fetch notice should precede the results"
+    assert "Weather for London" in captured.out, "Current weather should survive a forecast failure"
+    assert "Error: HTTP error occurred" in captured.out, "Forecast failure should be reported"
+    assert "5-Day Forecast" not in captured.out, "Failed forecast should not be displayed"